@@ -1,10 +1,16 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk
+import base64
 import json
 import os
+import re
+import sys
+import time
+from array import array
 from concurrent.futures import ThreadPoolExecutor
-from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 
 # Note: The 'requests' and 'BytesIO' imports have been removed as they are no longer
 # needed for loading online images.
@@ -15,6 +21,133 @@ CELL_SIZE = 20
 COLS = CANVAS_SIZE // CELL_SIZE
 ROWS = CANVAS_SIZE // CELL_SIZE
 COLOR_PALETTE = ["#000000", "#FFFFFF", "#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF"]
+PRELOAD_POLL_MS = 50  # How often pending image preloads are checked
+FRAME_MS = 16  # Minimum time between two canvas repaints (about 60 per second)
+
+# --- Cell Storage ---
+# Cell modes stored in `PixelCanvas.mode_grid`. MODE_BORDER only appears in
+# the one-cell sentinel border around the grid and never matches a cell.
+MODE_COLOR = 0
+MODE_IMAGE_LOCAL = 1
+MODE_BORDER = 255
+WHITE = 0xFFFFFF
+# Row length of the cell arrays, including the left and right border cells.
+STRIDE = COLS + 2
+HEX_COLOR = re.compile(r'#[0-9a-fA-F]{6}')
+
+def hex_to_rgb(color):
+    """
+    Packs a '#rrggbb' color string into a 0xRRGGBB integer.
+
+    Raises:
+        ValueError: If `color` is not a '#rrggbb' string.
+    """
+    if not isinstance(color, str) or not HEX_COLOR.fullmatch(color):
+        raise ValueError(f"Invalid color: {color!r}")
+    return int(color[1:], 16)
+
+@lru_cache(maxsize=256)
+def rgb_to_hex(value):
+    """
+    Unpacks a 0xRRGGBB integer into a '#rrggbb' color string. Results are
+    cached, so every cell of the same color shares one string object.
+    """
+    return f"#{value:06x}"
+
+def cell_index(row, col):
+    """Returns the flat index of a grid cell in the padded cell arrays."""
+    return (row + 1) * STRIDE + col + 1
+
+def cell_position(index):
+    """Returns the `(row, col)` grid position of a flat cell index."""
+    row, col = divmod(index, STRIDE)
+    return row - 1, col - 1
+
+def build_blank_modes():
+    """
+    Builds the mode layout of a blank canvas: MODE_COLOR cells surrounded
+    by a one-cell border whose mode is MODE_BORDER.
+    """
+    modes = bytearray([MODE_BORDER]) * (STRIDE * (ROWS + 2))
+    for row in range(ROWS):
+        start = cell_index(row, 0)
+        modes[start:start + COLS] = bytes(COLS)
+    return bytes(modes)
+
+# Blank canvas layout, built once and copied by `new_cell_arrays`.
+BLANK_MODES = build_blank_modes()
+BLANK_VALS = array('I', [WHITE]) * len(BLANK_MODES)
+
+def new_cell_arrays():
+    """
+    Creates blank (all white) cell arrays by copying the shared blank
+    layout, so clearing or loading a canvas is two buffer copies.
+
+    Returns:
+        tuple: The `(mode_grid, val_grid)` pair.
+    """
+    return bytearray(BLANK_MODES), array('I', BLANK_VALS)
+
+def flood_fill(mode_grid, val_grid, start, new_mode, new_val):
+    """
+    Fills the 4-connected region of cells sharing the content of the start
+    cell with `new_mode`/`new_val`, writing to the cell arrays in place.
+
+    This is a scanline fill: each seed is extended left and right to the
+    full horizontal run of matching cells, the run is written with one
+    slice assignment per array, and the rows above and below the run are
+    scanned for new seeds, one per run of matching cells. The sentinel
+    border never matches the target, so no bounds checks are needed.
+
+    Args:
+        mode_grid (bytearray): The padded, row-major cell modes.
+        val_grid (array): The padded, row-major cell values.
+        start (int): The flat index of the starting cell.
+        new_mode (int): The mode written to the filled cells.
+        new_val (int): The value written to the filled cells.
+
+    Returns:
+        array: The flat indices of the filled cells. Empty if the start
+        cell already holds the new content.
+    """
+    filled = array('i')
+    target_mode, target_val = mode_grid[start], val_grid[start]
+    if target_mode == new_mode and target_val == new_val:
+        return filled
+
+    mode_fill = bytes([new_mode])
+    val_fill = array('I', [new_val])
+    seeds = [start]
+
+    while seeds:
+        seed = seeds.pop()
+        # A seed may have been filled by another run since it was pushed.
+        if val_grid[seed] != target_val or mode_grid[seed] != target_mode:
+            continue
+
+        left = seed
+        while val_grid[left - 1] == target_val and mode_grid[left - 1] == target_mode:
+            left -= 1
+        right = seed + 1
+        while val_grid[right] == target_val and mode_grid[right] == target_mode:
+            right += 1
+
+        length = right - left
+        mode_grid[left:right] = mode_fill * length
+        val_grid[left:right] = val_fill * length
+        filled.extend(range(left, right))
+
+        for offset in (-STRIDE, STRIDE):
+            in_run = False
+            for index in range(left + offset, right + offset):
+                if val_grid[index] == target_val and mode_grid[index] == target_mode:
+                    if not in_run:
+                        seeds.append(index)
+                        in_run = True
+                else:
+                    in_run = False
+
+    return filled
 
 class PixelCanvas:
     """
@@ -54,15 +187,40 @@ class PixelCanvas:
         self.show_grid = True
         self.cell_size = CELL_SIZE
         
-        # grid_data stores the content of each cell.
-        # Format: {'mode': 'color'/'image_url'/'image_local', 'val': hex_color/url/path}
-        self.grid_data = [[{'mode': 'color', 'val': '#ffffff'} for _ in range(COLS)] for _ in range(ROWS)]
+        # The content of each cell is stored in two flat, row-major arrays
+        # indexed by `cell_index(row, col)`, padded with a sentinel border:
+        # - mode_grid holds the cell mode (MODE_COLOR or MODE_IMAGE_LOCAL).
+        # - val_grid holds a packed 0xRRGGBB color for color cells, or an
+        #   index into `image_paths` for image cells.
+        self.mode_grid, self.val_grid = new_cell_arrays()
+        self.image_paths = []
+        self.image_ids = {}
+
+        # Pending canvas updates, flushed once per Tk idle cycle. dirty_cells
+        # holds the flat cell indices that need repainting.
+        self.dirty_cells = set()
+        self.redraw_all = False
+        self.redraw_pending = False
+        self.last_flush = 0.0
+        self.batch_depth = 0
         
         # Caches to prevent garbage collection and repeated loading.
+        # cell_images maps an image path to a `(mtime_ns, image)` pair holding
+        # the cell-sized RGBA PIL image and the modification time of the file
+        # it was decoded from. It is keyed by path rather than image id because
+        # ids restart on every clear/load while decoded images are kept for the
+        # whole session; the mtime tells `image_is_current` if a file changed.
         self.cell_images = {}
+        # cell_photos maps an image path to a cell-sized Tk photo of the
+        # image over white, which `show_cell` copies onto the canvas.
+        self.cell_photos = {}
         self.color_swatch_images = {}
-        # Presets and loading queues for online images have been removed.
+        # Presets and loading queues for online images have been removed; the
+        # executor now decodes the images of loaded canvases (see `preload_images`).
         self.executor = ThreadPoolExecutor(max_workers=4)
+        # Preloads still running, by image path, and the pending poll job.
+        self.preload_futures = {}
+        self.preload_job = None
 
         # --- UI Setup and Initialization ---
         self.setup_ui()
@@ -135,40 +293,193 @@ class PixelCanvas:
         self.canvas.pack()
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_down)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
+
+        # All cells are painted into one PIL image, shown through a single
+        # PhotoImage item below the grid overlay.
+        self.canvas_image = Image.new('RGB', (CANVAS_SIZE, CANVAS_SIZE), 'white')
+        self.canvas_photo = ImageTk.PhotoImage(self.canvas_image)
+        self.canvas.create_image(0, 0, anchor='nw', image=self.canvas_photo)
+        self.create_grid_overlay()
         
         # Status Bar for user feedback
         self.status_label = tk.Label(self.root, text="", bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X)
-        self.root.bind("<Key>", self.toggle_grid)
+        self.root.bind("<Key-g>", self.toggle_grid)
+        self.root.bind("<Key-G>", self.toggle_grid)
         self.root.bind("<Escape>", lambda event: self.close_app())
 
     def redraw_canvas(self):
         """
-        Clears the canvas and redraws all cells based on the current state
-        of `self.grid_data`. Also draws grid lines if `self.show_grid` is True.
+        Re-renders all cells based on the current state of `self.mode_grid`
+        and `self.val_grid` and shows the result on the canvas.
         """
-        self.canvas.delete("all")
-        for row in range(ROWS):
-            for col in range(COLS):
-                x = col * self.cell_size
-                y = row * self.cell_size
-                cell = self.grid_data[row][col]
-                
-                if cell['mode'] == "color":
-                    self.canvas.create_rectangle(x, y, x + self.cell_size, y + self.cell_size,
-                                                 fill=cell['val'], outline="")
-                elif cell['mode'] == "image_local":
-                    image_key = (cell['mode'], cell['val'])
-                    if image_key in self.cell_images:
-                        self.canvas.create_image(x, y, anchor='nw', image=self.cell_images[image_key])
-                    else:
-                        # Draw a placeholder while image is loading
-                        self.canvas.create_rectangle(x, y, x + self.cell_size, y + self.cell_size, fill="#e0e0e0", outline="")
-        if self.show_grid:
-            for x in range(0, CANVAS_SIZE + 1, self.cell_size):
-                self.canvas.create_line(x, 0, x, CANVAS_SIZE, fill="#ddd")
-            for y in range(0, CANVAS_SIZE + 1, self.cell_size):
-                self.canvas.create_line(0, y, CANVAS_SIZE, y, fill="#ddd")
+        self.dirty_cells.clear()
+        self.redraw_all = False
+        self.canvas_image = self.render_image()
+        self.canvas_photo.paste(self.canvas_image)
+
+    def create_grid_overlay(self):
+        """
+        Renders the grid lines once into a transparent PhotoImage and places
+        it on the canvas as a single item. Toggling the grid only changes the
+        visibility of this item.
+        """
+        # One pixel larger than the canvas so the closing right and bottom
+        # lines at CANVAS_SIZE are drawn too.
+        self.grid_overlay = tk.PhotoImage(width=CANVAS_SIZE + 1, height=CANVAS_SIZE + 1)
+        for x in range(0, CANVAS_SIZE + 1, self.cell_size):
+            self.grid_overlay.put("#dddddd", to=(x, 0, x + 1, CANVAS_SIZE))
+        for y in range(0, CANVAS_SIZE + 1, self.cell_size):
+            self.grid_overlay.put("#dddddd", to=(0, y, CANVAS_SIZE, y + 1))
+        self.grid_item = self.canvas.create_image(0, 0, anchor='nw', image=self.grid_overlay,
+                                                  state='normal' if self.show_grid else 'hidden')
+
+    def paint_cell(self, img, index):
+        """
+        Paints a single cell into a canvas-sized PIL image.
+
+        Args:
+            img (Image.Image): The image to paint into.
+            index (int): The flat index of the cell.
+        """
+        row, col = cell_position(index)
+        x = col * self.cell_size
+        y = row * self.cell_size
+        box = (x, y, x + self.cell_size, y + self.cell_size)
+        val = self.val_grid[index]
+
+        if self.mode_grid[index] == MODE_COLOR:
+            img.paste(rgb_to_hex(val), box)
+            return
+
+        cached = self.cell_images.get(self.image_paths[val])
+        if cached is None:
+            # Draw a placeholder while image is loading
+            img.paste("#e0e0e0", box)
+        else:
+            # Transparent parts of the image show a white cell.
+            cell_img = cached[1]
+            img.paste("#ffffff", box)
+            img.paste(cell_img, (x, y), cell_img)
+
+    def show_cell(self, index):
+        """
+        Updates a single cell of the on-screen photo from `self.canvas_image`
+        without sending the rest of the canvas to Tk. Color cells and
+        placeholders are filled with Tk's `put`; image cells are copied from
+        a cell photo, created once per image and kept in `self.cell_photos`.
+
+        Args:
+            index (int): The flat index of a cell already painted by `paint_cell`.
+        """
+        row, col = cell_position(index)
+        x = col * self.cell_size
+        y = row * self.cell_size
+        box = (x, y, x + self.cell_size, y + self.cell_size)
+        target = str(self.canvas_photo)
+        val = self.val_grid[index]
+
+        if self.mode_grid[index] == MODE_COLOR:
+            self.canvas.tk.call(target, 'put', rgb_to_hex(val), '-to', *box)
+            return
+
+        path = self.image_paths[val]
+        if path not in self.cell_images:
+            self.canvas.tk.call(target, 'put', "#e0e0e0", '-to', *box)
+            return
+
+        cell_photo = self.cell_photos.get(path)
+        if cell_photo is None:
+            cell_photo = self.cell_photos[path] = ImageTk.PhotoImage(self.canvas_image.crop(box))
+        self.canvas.tk.call(target, 'copy', str(cell_photo), '-to', x, y)
+
+    def intern_image(self, file_path):
+        """
+        Returns the index of `file_path` in `self.image_paths`, adding it
+        if it is not referenced yet. Image cells store this index.
+
+        Args:
+            file_path (str): The local path of the image.
+        """
+        image_id = self.image_ids.get(file_path)
+        if image_id is None:
+            image_id = len(self.image_paths)
+            self.image_paths.append(file_path)
+            self.image_ids[file_path] = image_id
+        return image_id
+
+    def brush_content(self):
+        """
+        Returns the `(mode, val)` pair the current brush paints with, or None
+        if no brush is available. The fill tool reuses the last selected
+        color or image.
+        """
+        if self.current_image_info and self.current_mode in ("image", "fill"):
+            return MODE_IMAGE_LOCAL, self.intern_image(self.current_image_info['val'])
+        if self.current_mode in ("color", "erase", "fill"):
+            return MODE_COLOR, hex_to_rgb(self.current_color)
+        return None
+
+    def mark_dirty(self, row, col):
+        """
+        Flags a single cell as needing to be repainted.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        self.dirty_cells.add(cell_index(row, col))
+
+    def mark_all_dirty(self):
+        """Flags the whole canvas as needing to be rebuilt."""
+        self.redraw_all = True
+
+    def schedule_redraw(self):
+        """
+        Schedules `flush_redraw` to run once the Tk event loop is idle, or at
+        the start of the next frame if the canvas was repainted less than
+        FRAME_MS ago. Repeated calls before the flush collapse into a single
+        repaint, so fast drags paint once per frame rather than per event.
+        """
+        if self.redraw_pending or self.batch_depth:
+            return
+        self.redraw_pending = True
+        delay_ms = int((self.last_flush - time.monotonic()) * 1000) + FRAME_MS
+        if delay_ms > 0:
+            self.root.after(delay_ms, self.flush_redraw)
+        else:
+            self.root.after_idle(self.flush_redraw)
+
+    def flush_redraw(self):
+        """
+        Repaints everything flagged since the last flush. Only the dirty cells
+        are painted and sent to Tk, unless `mark_all_dirty` was called or so
+        many cells are dirty that re-rendering the whole canvas and copying
+        it to the screen in one pass is cheaper.
+        """
+        self.redraw_pending = False
+        self.last_flush = time.monotonic()
+        if self.redraw_all or len(self.dirty_cells) > ROWS * COLS // 4:
+            self.redraw_canvas()
+            return
+        for index in self.dirty_cells:
+            self.paint_cell(self.canvas_image, index)
+            self.show_cell(index)
+        self.dirty_cells.clear()
+
+    @contextmanager
+    def batch_updates(self):
+        """
+        Context manager that defers repainting until the outermost batch
+        exits, so intermediate states of a bulk edit are never drawn.
+        """
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if self.redraw_all or self.dirty_cells:
+                self.schedule_redraw()
 
     def handle_canvas_event(self, event):
         """
@@ -180,86 +491,98 @@ class PixelCanvas:
         """
         col = event.x // self.cell_size
         row = event.y // self.cell_size
-
         if 0 <= col < COLS and 0 <= row < ROWS:
             if self.current_mode == "fill":
                 self.fill_area(row, col)
             else:
-                self.draw_pixel(row, col)
+                self.draw_pixel(row, col, self.brush_content())
 
-    def draw_pixel(self, row, col):
+    def draw_pixel(self, row, col, content):
         """
-        Draws a single pixel at the specified grid coordinates using the
-        current brush mode and value.
+        Draws a single pixel at the specified grid coordinates with the given
+        brush content. Nothing is repainted if the cell already holds that
+        content.
         
         Args:
             row (int): The row index of the cell.
             col (int): The column index of the cell.
+            content (tuple): The `(mode, val)` pair from `brush_content`, or
+                None if no brush is available.
         """
-        if self.current_mode == "color":
-            self.grid_data[row][col] = {'mode': 'color', 'val': self.current_color}
-        elif self.current_mode == "image" and self.current_image_info:
-            self.grid_data[row][col] = {'mode': self.current_image_info['type'], 'val': self.current_image_info['val']}
-        elif self.current_mode == "erase":
-            self.grid_data[row][col] = {'mode': 'color', 'val': '#ffffff'}
+        index = cell_index(row, col)
+        if content is None or (self.mode_grid[index], self.val_grid[index]) == content:
+            return
+        self.mode_grid[index], self.val_grid[index] = content
         
-        self.redraw_canvas()
+        self.mark_dirty(row, col)
+        self.schedule_redraw()
 
     def fill_area(self, start_row, start_col):
         """
-        Performs a flood-fill algorithm starting from a given cell.
-        It replaces all contiguous cells of the same type as the starting cell
-        with the current brush content. This is implemented using a breadth-first
-        search (BFS) with a deque for optimal performance.
+        Performs a flood-fill starting from a given cell. It replaces all
+        contiguous cells of the same type as the starting cell with the
+        current brush content, using the `flood_fill` kernel on the cell arrays.
         
         Args:
             start_row (int): The starting row index for the fill.
             start_col (int): The starting column index for the fill.
         """
-        target_cell = self.grid_data[start_row][start_col]
-        
-        if self.current_mode == "color":
-            new_content = {'mode': 'color', 'val': self.current_color}
-        elif self.current_mode == "image" and self.current_image_info:
-            new_content = {'mode': self.current_image_info['type'], 'val': self.current_image_info['val']}
-        elif self.current_mode == "erase":
-            new_content = {'mode': 'color', 'val': '#ffffff'}
-        else:
+        content = self.brush_content()
+        if content is None:
             self.update_status("Error: Select a brush (color/image) before using the fill tool.")
             return
 
-        # Avoid filling with the same content as the target cell.
-        if target_cell == new_content:
+        filled = flood_fill(self.mode_grid, self.val_grid, cell_index(start_row, start_col), *content)
+        # Nothing is filled when the target cell already has the new content.
+        if not filled:
             return
 
-        q = deque([(start_row, start_col)])
-        self.grid_data[start_row][start_col] = new_content
-        
-        while q:
-            row, col = q.popleft()
-            
-            # Check the four neighboring cells (up, down, left, right)
-            for d_row, d_col in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                n_row, n_col = row + d_row, col + d_col
-
-                if 0 <= n_row < ROWS and 0 <= n_col < COLS and self.grid_data[n_row][n_col] == target_cell:
-                    self.grid_data[n_row][n_col] = new_content
-                    q.append((n_row, n_col))
+        with self.batch_updates():
+            self.dirty_cells.update(filled)
 
-        self.redraw_canvas()
         self.update_status("Fill operation complete!")
 
+    def make_stroke_handler(self, event):
+        """
+        Builds the `<B1-Motion>` callback for one drag stroke. The brush cannot
+        change while the button is held, so the brush content, cell size, grid
+        bounds and `draw_pixel` are resolved once as locals instead of being
+        looked up on every motion event. Motion events that stay within the
+        last handled cell are ignored.
+
+        Args:
+            event (tk.Event): The button press event that started the stroke.
+
+        Returns:
+            function: The motion event callback.
+        """
+        content = self.brush_content()
+        cell_size = self.cell_size
+        cols, rows = COLS, ROWS
+        draw = self.draw_pixel
+        last_cell = (event.y // cell_size, event.x // cell_size)
+
+        def on_stroke_motion(event):
+            nonlocal last_cell
+            row = event.y // cell_size
+            col = event.x // cell_size
+            if (row, col) == last_cell:
+                return
+            last_cell = (row, col)
+            if 0 <= col < cols and 0 <= row < rows:
+                draw(row, col, content)
+
+        return on_stroke_motion
+
     def on_mouse_down(self, event):
         """
         Handles the mouse button press event. If the fill tool is not selected,
-        it binds the `handle_canvas_event` to the `<B1-Motion>` event for
-        continuous drawing.
+        it binds a stroke handler from `make_stroke_handler` to the
+        `<B1-Motion>` event for continuous drawing.
         """
+        self.handle_canvas_event(event)
         if self.current_mode != "fill":
-            self.handle_canvas_event(event)
-            self.canvas.bind("<B1-Motion>", self.handle_canvas_event)
-        else:
-            self.handle_canvas_event(event)
+            self.canvas.bind("<B1-Motion>", self.make_stroke_handler(event))
 
     def on_mouse_up(self, event):
         """Unbinds the continuous drawing motion event when the mouse button is released."""
@@ -267,16 +590,15 @@ class PixelCanvas:
 
     def toggle_grid(self, event):
         """
-        Toggles the visibility of the grid lines on the canvas when the 'g'
-        key is pressed.
+        Toggles the visibility of the grid lines on the canvas. Bound to the
+        'g' and 'G' keys only.
         
         Args:
             event (tk.Event): The key press event object.
         """
-        if event.char.lower() == 'g':
-            self.show_grid = not self.show_grid
-            self.redraw_canvas()
-            self.update_status("Grid lines are now " + ("visible" if self.show_grid else "hidden") + ". Press 'G' to toggle again.")
+        self.show_grid = not self.show_grid
+        self.canvas.itemconfigure(self.grid_item, state='normal' if self.show_grid else 'hidden')
+        self.update_status("Grid lines are now " + ("visible" if self.show_grid else "hidden") + ". Press 'G' to toggle again.")
 
     def clear_canvas(self):
         """
@@ -284,10 +606,135 @@ class PixelCanvas:
         a confirmation dialog.
         """
         if messagebox.askyesno("Clear Canvas", "Are you sure you want to clear the entire canvas? This cannot be undone."):
-            self.grid_data = [[{'mode': 'color', 'val': '#ffffff'} for _ in range(COLS)] for _ in range(ROWS)]
-            self.redraw_canvas()
+            with self.batch_updates():
+                self.cancel_preloads()
+                self.reset_cells()
+                self.mark_all_dirty()
             self.update_status("Canvas cleared.")
 
+    def reset_cells(self):
+        """Resets every cell to white and forgets all referenced image paths."""
+        self.mode_grid, self.val_grid = new_cell_arrays()
+        self.image_paths = []
+        self.image_ids = {}
+
+    def cells_to_json(self):
+        """
+        Converts the cell arrays into the saved JSON layout. The modes and
+        values of all cells (without the sentinel border) are stored as two
+        base64 blobs, one byte and one little-endian uint32 per cell, along
+        with the list of image paths that image cell values index into. Only
+        images still held by a cell are listed, renumbered in order.
+
+        Returns:
+            dict: The `rows`, `cols`, `mode_b64`, `val_b64` and `images` fields.
+        """
+        modes = bytearray()
+        vals = array('I')
+        for row in range(ROWS):
+            start = cell_index(row, 0)
+            modes += self.mode_grid[start:start + COLS]
+            vals.extend(self.val_grid[start:start + COLS])
+
+        # Brushes that were picked but painted nothing, or whose cells have
+        # all been painted over, are dropped.
+        image_cells = []
+        index = modes.find(MODE_IMAGE_LOCAL)
+        while index != -1:
+            image_cells.append(index)
+            index = modes.find(MODE_IMAGE_LOCAL, index + 1)
+        used_ids = sorted({vals[index] for index in image_cells})
+        new_ids = {image_id: new_id for new_id, image_id in enumerate(used_ids)}
+        for index in image_cells:
+            vals[index] = new_ids[vals[index]]
+
+        if sys.byteorder == 'big':
+            vals.byteswap()
+        return {
+            'rows': ROWS,
+            'cols': COLS,
+            'mode_b64': base64.b64encode(modes).decode('ascii'),
+            'val_b64': base64.b64encode(vals.tobytes()).decode('ascii'),
+            'images': [self.image_paths[image_id] for image_id in used_ids],
+        }
+
+    def cells_from_json(self, data):
+        """
+        Replaces the cell arrays with the contents of a saved JSON canvas.
+        Both the packed layout written by `cells_to_json` and the older
+        ROWS x COLS list of `{'mode', 'val'}` dicts are accepted.
+
+        Args:
+            data (dict or list): The decoded JSON document.
+
+        Raises:
+            ValueError: If the dimensions or cell contents are invalid.
+        """
+        if isinstance(data, list):
+            self.cells_from_grid_data(data)
+            return
+
+        if data.get('rows') != ROWS or data.get('cols') != COLS:
+            raise ValueError("Invalid file format. Grid dimensions do not match.")
+        modes = base64.b64decode(data['mode_b64'])
+        vals = array('I')
+        vals.frombytes(base64.b64decode(data['val_b64']))
+        if sys.byteorder == 'big':
+            vals.byteswap()
+        image_paths = [str(path) for path in data['images']]
+        if len(modes) != ROWS * COLS or len(vals) != ROWS * COLS:
+            raise ValueError("Invalid file format. Cell data does not match the grid dimensions.")
+        if len(set(image_paths)) != len(image_paths):
+            raise ValueError("Invalid file format. Duplicate image paths.")
+        if modes.translate(None, bytes([MODE_COLOR, MODE_IMAGE_LOCAL])):
+            raise ValueError("Invalid file format. Unknown cell mode.")
+        for mode, val in zip(modes, vals):
+            if val >= (len(image_paths) if mode == MODE_IMAGE_LOCAL else WHITE + 1):
+                raise ValueError("Invalid file format. Cell value out of range.")
+
+        mode_grid, val_grid = new_cell_arrays()
+        for row in range(ROWS):
+            start = cell_index(row, 0)
+            mode_grid[start:start + COLS] = modes[row * COLS:(row + 1) * COLS]
+            val_grid[start:start + COLS] = vals[row * COLS:(row + 1) * COLS]
+        self.mode_grid, self.val_grid = mode_grid, val_grid
+        self.image_paths = image_paths
+        self.image_ids = {path: image_id for image_id, path in enumerate(image_paths)}
+
+    def cells_from_grid_data(self, grid_data):
+        """
+        Replaces the cell arrays with the contents of a canvas saved in the
+        older list-of-dicts layout. Cells with an unsupported mode are loaded
+        as blank (white) cells.
+
+        Args:
+            grid_data (list): A ROWS x COLS list of `{'mode', 'val'}` dicts.
+
+        Raises:
+            ValueError: If the grid dimensions do not match or a color cell
+                does not hold a '#rrggbb' string.
+        """
+        if len(grid_data) != ROWS or any(len(row) != COLS for row in grid_data):
+            raise ValueError("Invalid file format. Grid dimensions do not match.")
+
+        mode_grid, val_grid = new_cell_arrays()
+        image_paths = []
+        image_ids = {}
+        for row in range(ROWS):
+            for col in range(COLS):
+                cell = grid_data[row][col]
+                index = cell_index(row, col)
+                if cell['mode'] == 'color':
+                    val_grid[index] = hex_to_rgb(cell['val'])
+                elif cell['mode'] == 'image_local':
+                    if cell['val'] not in image_ids:
+                        image_ids[cell['val']] = len(image_paths)
+                        image_paths.append(cell['val'])
+                    mode_grid[index] = MODE_IMAGE_LOCAL
+                    val_grid[index] = image_ids[cell['val']]
+        self.mode_grid, self.val_grid = mode_grid, val_grid
+        self.image_paths, self.image_ids = image_paths, image_ids
+
     def select_color(self, color):
         """
         Sets the current drawing mode to "color" and updates the selected color.
@@ -322,11 +769,14 @@ class PixelCanvas:
             return
         
         try:
-            img = Image.open(file_path).resize((self.cell_size, self.cell_size), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+            if not self.image_is_current(file_path):
+                self.cell_images[file_path] = self.open_cell_image(file_path)
+                self.cell_photos.pop(file_path, None)
+                # Cells already showing an older decode of the file are repainted.
+                self.dirty_cells.update(self.cells_using_image(self.image_ids.get(file_path)))
+                self.schedule_redraw()
             self.current_mode = "image"
             self.current_image_info = {'type': 'image_local', 'val': file_path}
-            self.cell_images[('image_local', file_path)] = photo
             self.update_status(f"Tool: Image, File: {os.path.basename(file_path)}")
         except Exception as e:
             messagebox.showerror("Error", f"Could not load image:\n{e}")
@@ -340,8 +790,11 @@ class PixelCanvas:
                                                  filetypes=[("JSON files", "*.json")])
         if file_path:
             try:
+                # Encode in one shot with compact separators; json.dump would
+                # stream many small chunks through the file object.
+                data = json.dumps(self.cells_to_json(), separators=(',', ':'))
                 with open(file_path, 'w') as f:
-                    json.dump(self.grid_data, f)
+                    f.write(data)
                 self.update_status(f"Canvas saved to {os.path.basename(file_path)}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save canvas:\n{e}")
@@ -356,20 +809,14 @@ class PixelCanvas:
         
         if file_path:
             try:
-                with open(file_path, 'r') as f:
-                    new_grid_data = json.load(f)
-                    if len(new_grid_data) != ROWS or any(len(row) != COLS for row in new_grid_data):
-                         raise ValueError("Invalid file format. Grid dimensions do not match.")
-                    
-                    self.grid_data = new_grid_data
-                    self.cell_images.clear()
-                    
-                    for row in range(ROWS):
-                        for col in range(COLS):
-                            cell = self.grid_data[row][col]
-                            if cell['mode'] == 'image_local' and ('image_local', cell['val']) not in self.cell_images:
-                                self.preload_image_from_local(cell['val'])
-                    self.redraw_canvas()
+                with open(file_path, 'r') as f, self.batch_updates():
+                    self.cells_from_json(json.load(f))
+                    self.cancel_preloads()
+                    # Images decoded earlier in the session are reused unless
+                    # their file has changed since.
+                    self.preload_images([path for path in self.image_paths
+                                         if not self.image_is_current(path)])
+                    self.mark_all_dirty()
                     self.update_status(f"Canvas loaded from {os.path.basename(file_path)}")
             except (IOError, json.JSONDecodeError) as e:
                 messagebox.showerror("Error", f"Failed to load canvas. Invalid file or format:\n{e}")
@@ -379,22 +826,132 @@ class PixelCanvas:
                 self.update_status("Failed to load canvas.")
 
     # The `preload_image_from_url`, `cache_and_redraw`, and `handle_preload_error` methods have been removed.
-    # The `preload_image_from_local` method is kept and will handle local images.
+    # Local images are decoded by `open_cell_image` and cached by `store_preloaded_image`.
+
+    def open_cell_image(self, file_path):
+        """
+        Opens a local image, resizes it to the cell size and converts it to
+        RGBA so it can be pasted with its own transparency mask. This does not
+        touch Tk, so it is safe to run on the executor's worker threads.
+
+        Args:
+            file_path (str): The local path of the image.
+
+        Returns:
+            tuple: The `(mtime_ns, image)` entry for `self.cell_images`, with
+                the file's modification time taken before it was read.
+        """
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        size = (self.cell_size, self.cell_size)
+        # Cells are only a few pixels wide, so a filtered resample is not
+        # visibly better than NEAREST but is much slower on large sources.
+        # `draft` lets JPEGs decode at a reduced scale that is still at least
+        # the cell size; other formats ignore it.
+        with Image.open(file_path) as img:
+            img.draft(None, size)
+            return mtime_ns, img.resize(size, Image.NEAREST).convert('RGBA')
+
+    def image_is_current(self, file_path):
+        """
+        Checks whether `self.cell_images` holds a decode of the file as it is
+        now on disk.
+
+        Args:
+            file_path (str): The local path of the image.
 
-    def preload_image_from_local(self, file_path):
-        """Loads a single image from a local path and caches it."""
+        Returns:
+            bool: False if the image is not cached, or the file has been
+                modified or removed since it was decoded.
+        """
+        cached = self.cell_images.get(file_path)
+        if cached is None:
+            return False
         try:
-            img = Image.open(file_path).resize((self.cell_size, self.cell_size), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            self.cell_images[('image_local', file_path)] = photo
-            self.redraw_canvas()
+            return os.stat(file_path).st_mtime_ns == cached[0]
+        except OSError:
+            return False
+
+    def preload_images(self, file_paths):
+        """
+        Decodes the given images in parallel on the executor. The cells using
+        them show a placeholder until `finish_preloads` caches the results.
+
+        Args:
+            file_paths (list): The local paths of the images to load.
+        """
+        for path in file_paths:
+            if path not in self.preload_futures:
+                self.preload_futures[path] = self.executor.submit(self.open_cell_image, path)
+        if self.preload_futures and self.preload_job is None:
+            self.preload_job = self.root.after(PRELOAD_POLL_MS, self.finish_preloads)
+
+    def finish_preloads(self):
+        """
+        Caches every finished preload on the Tk thread and checks again later
+        for those still running. All images that finished in the same poll
+        share a single repaint of the cells that use them.
+        """
+        self.preload_job = None
+        finished = [path for path, future in self.preload_futures.items() if future.done()]
+        with self.batch_updates():
+            for file_path in finished:
+                self.store_preloaded_image(file_path, self.preload_futures.pop(file_path))
+
+        if self.preload_futures:
+            self.preload_job = self.root.after(PRELOAD_POLL_MS, self.finish_preloads)
+
+    def cancel_preloads(self):
+        """
+        Drops all pending preloads. Preloads that have not started are
+        cancelled; the results of running ones are ignored.
+        """
+        if self.preload_job is not None:
+            self.root.after_cancel(self.preload_job)
+            self.preload_job = None
+        for future in self.preload_futures.values():
+            future.cancel()
+        self.preload_futures.clear()
+
+    def store_preloaded_image(self, file_path, future):
+        """
+        Caches an image decoded by a preload worker and marks the cells using
+        it dirty. If the load failed, those cells are reset to white.
+
+        Args:
+            file_path (str): The local path of the image.
+            future (Future): The finished `open_cell_image` call.
+        """
+        cells = self.cells_using_image(self.image_ids.get(file_path))
+        try:
+            self.cell_images[file_path] = future.result()
+            self.cell_photos.pop(file_path, None)
         except Exception:
             # Fallback to an empty cell on error
-            for r, row in enumerate(self.grid_data):
-                for c, cell in enumerate(row):
-                    if cell['mode'] == 'image_local' and cell['val'] == file_path:
-                        self.grid_data[r][c] = {'mode': 'color', 'val': '#ffffff'}
-            self.redraw_canvas()
+            for index in cells:
+                self.mode_grid[index] = MODE_COLOR
+                self.val_grid[index] = WHITE
+        self.dirty_cells.update(cells)
+
+    def cells_using_image(self, image_id):
+        """
+        Finds the cells that show the given image.
+
+        Args:
+            image_id (int): The index of the image in `self.image_paths`, or
+                None if it is not used by the grid.
+
+        Returns:
+            list: The flat indices of the cells.
+        """
+        cells = []
+        if image_id is None:
+            return cells
+        index = self.mode_grid.find(MODE_IMAGE_LOCAL)
+        while index != -1:
+            if self.val_grid[index] == image_id:
+                cells.append(index)
+            index = self.mode_grid.find(MODE_IMAGE_LOCAL, index + 1)
+        return cells
 
     def export_as_image(self):
         """
@@ -405,33 +962,33 @@ class PixelCanvas:
                                                  filetypes=[("PNG files", "*.png")])
         if file_path:
             try:
-                img = Image.new('RGB', (CANVAS_SIZE, CANVAS_SIZE), 'white')
-                draw = ImageDraw.Draw(img)
-
-                for row in range(ROWS):
-                    for col in range(COLS):
-                        x1 = col * self.cell_size
-                        y1 = row * self.cell_size
-                        x2 = x1 + self.cell_size
-                        y2 = y1 + self.cell_size
-                        cell = self.grid_data[row][col]
-
-                        if cell['mode'] == "color":
-                            draw.rectangle([x1, y1, x2, y2], fill=cell['val'])
-                        elif cell['mode'] == "image_local":
-                            image_key = (cell['mode'], cell['val'])
-                            if image_key in self.cell_images:
-                                cell_img = self.cell_images[image_key]
-                                cell_pil_img = ImageTk.getimage(cell_img)
-                                img.paste(cell_pil_img, (x1, y1))
-                            else:
-                                draw.rectangle([x1, y1, x2, y2], fill="#e0e0e0")
-
-                img.save(file_path)
+                # Rendered from the cell arrays and the current decodes rather
+                # than copied from the screen, which may lag behind them.
+                self.render_image().save(file_path)
                 self.update_status(f"Canvas exported to {os.path.basename(file_path)}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export canvas as image:\n{e}")
 
+    def render_image(self):
+        """
+        Renders the cells into a single PIL image. Color cells are unpacked
+        from `self.val_grid` in one pass and scaled up to the cell size with
+        nearest-neighbor resampling; image cells are then pasted on top.
+
+        Returns:
+            Image.Image: An RGB image of size CANVAS_SIZE x CANVAS_SIZE.
+        """
+        # val_grid holds native-endian 0x00RRGGBB words.
+        rawmode = 'BGRX' if sys.byteorder == 'little' else 'XRGB'
+        img = Image.frombytes('RGB', (STRIDE, ROWS + 2), self.val_grid.tobytes(), 'raw', rawmode)
+        img = img.crop((1, 1, COLS + 1, ROWS + 1)).resize((CANVAS_SIZE, CANVAS_SIZE), Image.NEAREST)
+
+        index = self.mode_grid.find(MODE_IMAGE_LOCAL)
+        while index != -1:
+            self.paint_cell(img, index)
+            index = self.mode_grid.find(MODE_IMAGE_LOCAL, index + 1)
+        return img
+
     def update_status(self, message):
         """Updates the status bar with the given message."""
         self.status_label.config(text=message)
@@ -441,7 +998,8 @@ class PixelCanvas:
         Properly shuts down the thread pool and closes the application.
         This is bound to the window close event to ensure a clean exit.
         """
-        self.executor.shutdown(wait=False)
+        self.cancel_preloads()
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
 
 if __name__ == "__main__":